@@ -1,5 +1,7 @@
+import copy
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Match, Optional, Tuple, Union
 
 import yaml
@@ -18,6 +20,9 @@ try:
 except ImportError:  # pragma: no cover
     attr = None  # type: ignore # pragma: no cover
 
+# exact types of the primitive values that can be stored in an AnyNode as is (Enum aside)
+_PRIMITIVE_TYPES = (int, float, bool, str, type(None))
+
 
 def isint(s: str) -> bool:
     try:
@@ -27,8 +32,14 @@ def isint(s: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
 def get_yaml_loader() -> Any:
-    loader = yaml.SafeLoader
+    # The loader is built once: add_implicit_resolver() appends to the resolvers of
+    # the class on every call. Subclassing keeps yaml.SafeLoader itself unmodified.
+    class OmegaConfLoader(yaml.SafeLoader):  # type: ignore
+        pass
+
+    loader = OmegaConfLoader
     loader.add_implicit_resolver(
         "tag:yaml.org,2002:float",
         re.compile(
@@ -54,6 +65,18 @@ def get_yaml_loader() -> Any:
     return loader
 
 
+@lru_cache(maxsize=512)
+def _load_yaml_cached(text: str) -> Any:
+    return yaml.load(text, Loader=get_yaml_loader())
+
+
+def load_yaml_str(text: str) -> Any:
+    """
+    Parses a YAML string. Results are cached by text, a copy is returned to the caller.
+    """
+    return copy.deepcopy(_load_yaml_cached(text))
+
+
 def _resolve_optional(type_: Any) -> Tuple[bool, Any]:
     from typing import Union
 
@@ -214,7 +237,7 @@ def get_value_kind(value: Any, return_match_list: bool = False) -> Any:
         else:
             return value_kind
 
-    if value == "???":
+    if _is_missing_literal(value):
         return ret(ValueKind.MANDATORY_MISSING)
 
     match_list = list(re.finditer(key_prefix + legal_characters, value))
@@ -227,6 +250,10 @@ def get_value_kind(value: Any, return_match_list: bool = False) -> Any:
         return ret(ValueKind.STR_INTERPOLATION)
 
 
+def _is_missing_literal(value: Any) -> bool:
+    return type(value) is str and value == "???"
+
+
 def decode_primitive(s: str) -> Any:
     def is_bool(st: str) -> bool:
         st = str.lower(st)
@@ -258,22 +285,80 @@ def decode_primitive(s: str) -> Any:
     return s
 
 
+_YAML_BOOL_OR_NULL = ("yes", "no", "true", "false", "on", "off", "null")
+
+
+def _yaml_plain_scalar(value: Any) -> Optional[str]:
+    """
+    :return: value as yaml.dump() emits it, or None if it may need quoting or escaping
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return str(value)
+    # identifiers (including non ASCII ones, emitted as is with allow_unicode=True)
+    # never need quoting unless they read as a bool or null.
+    if (
+        type(value) is str
+        and len(value) <= 100
+        and value.isidentifier()
+        and value.lower() not in _YAML_BOOL_OR_NULL
+    ):
+        return value
+    return None
+
+
+def pretty_plain_list(lst: List[Any]) -> Optional[str]:
+    """
+    Emits a list of scalars and flat dicts of scalars without going through yaml.dump().
+    The output is identical to yaml.dump(lst, default_flow_style=False, allow_unicode=True).
+    :param lst: primitive list
+    :return: the YAML string, or None if the list contains other values
+    """
+    if len(lst) == 0:
+        return None
+    lines = []
+    for item in lst:
+        if type(item) is dict:
+            if len(item) == 0:
+                lines.append("- {}")
+                continue
+            prefix = "- "
+            for key in sorted(item.keys()):
+                k = _yaml_plain_scalar(key)
+                v = _yaml_plain_scalar(item[key])
+                if type(key) is not str or k is None or v is None:
+                    return None
+                lines.append(f"{prefix}{k}: {v}")
+                prefix = "  "
+        else:
+            v = _yaml_plain_scalar(item)
+            if v is None:
+                return None
+            lines.append(f"- {v}")
+    lines.append("")
+    return "\n".join(lines)
+
+
 # noinspection PyProtectedMember
 def _re_parent(node: Node) -> None:
-    from .dictconfig import DictConfig
-    from .listconfig import ListConfig
-
-    # update parents of first level Config nodes to self
+    from .basecontainer import BaseContainer
 
+    # update parents of all nested nodes, walking only into containers.
+    # ValueNodes have no children and are reparented without being visited.
     assert isinstance(node, Node)
-    if isinstance(node, DictConfig):
-        for _key, value in node.__dict__["content"].items():
-            value._set_parent(node)
-            _re_parent(value)
-    elif isinstance(node, ListConfig):
-        for item in node.__dict__["content"]:
-            item._set_parent(node)
-            _re_parent(item)
+    stack = [node] if isinstance(node, BaseContainer) else []
+    while len(stack) > 0:
+        parent = stack.pop()
+        content = parent.__dict__["content"]
+        for child in content.values() if isinstance(content, dict) else content:
+            child.__dict__["parent"] = parent
+            if isinstance(child, BaseContainer):
+                stack.append(child)
 
 
 def is_primitive_list(obj: Any) -> bool:
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterator, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
+
+# Flags of nodes that never had a flag set. Shared to avoid allocating a dict per node,
+# _set_flag() replaces it with a dict owned by the node before the first write.
+_NO_FLAGS: Dict[str, Optional[bool]] = {}
 
 
 class Node(ABC):
@@ -10,7 +14,15 @@ class Node(ABC):
         #   unset : inherit from parent (None if no parent specifies)
         #   set to true: flag is true
         #   set to false: flag is false
-        self.__dict__["flags"] = {}
+        self.__dict__["flags"] = _NO_FLAGS
+
+    # Support pickle
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        self.__dict__.update(d)
+        # pickle restores one empty dict for all the nodes sharing _NO_FLAGS,
+        # share _NO_FLAGS again so _set_flag() does not write into that dict.
+        if not self.__dict__.get("flags"):
+            self.__dict__["flags"] = _NO_FLAGS
 
     def _set_parent(self, parent: Optional["Container"]) -> None:
         assert parent is None or isinstance(parent, Container)
@@ -29,8 +41,14 @@ class Node(ABC):
 
     def _set_flag(self, flag: str, value: Optional[bool]) -> None:
         assert value is None or isinstance(value, bool)
+        if self.__dict__["flags"] is _NO_FLAGS:
+            self.__dict__["flags"] = {}
         self.__dict__["flags"][flag] = value
 
+    def _copy_flags(self) -> Dict[str, Optional[bool]]:
+        flags: Dict[str, Optional[bool]] = self.__dict__["flags"]
+        return flags if flags is _NO_FLAGS else dict(flags)
+
     def _get_node_flag(self, flag: str) -> Optional[bool]:
         """
         :param flag: flag to inspect
@@ -9,9 +9,11 @@ import yaml
 
 from ._utils import (
     ValueKind,
+    _is_missing_literal,
     _re_parent,
     get_value_kind,
-    get_yaml_loader,
+    load_yaml_str,
+    pretty_plain_list,
     is_primitive_container,
     is_structured_config,
 )
@@ -32,6 +34,8 @@ class BaseContainer(Container):
         self.__dict__["content"] = None
         self.__dict__["_resolver_cache"] = defaultdict(dict)
         self.__dict__["_element_type"] = element_type
+        # cached key of this container in its parent, see _get_key_in_parent()
+        self.__dict__["_key_in_parent"] = None
 
     def save(self, f: str) -> None:
         warnings.warn(
@@ -50,60 +54,76 @@ class BaseContainer(Container):
         """returns the value with the specified key, like obj.key and obj['key']"""
         from .nodes import ValueNode
 
-        def is_mandatory_missing(val: Any) -> bool:
-            return type(val) == str and val == "???"
-
         if isinstance(value, ValueNode):
+            is_missing = value._is_missing()
             value = value.value()
+        else:
+            is_missing = _is_missing_literal(value)
 
-        if default_value is not None and (value is None or is_mandatory_missing(value)):
+        if default_value is not None and (value is None or is_missing):
             value = default_value
 
         value = self._resolve_single(value) if isinstance(value, str) else value
-        if is_mandatory_missing(value):
+        if _is_missing_literal(value):
             raise MissingMandatoryValue(self.get_full_key(str(key)))
 
         return value
 
     def get_full_key(self, key: str) -> str:
-        from .dictconfig import DictConfig
         from .listconfig import ListConfig
 
-        full_key: Union[str, int] = ""
-        child = None
-        parent: Container = self
+        if isinstance(self, ListConfig):
+            full_key = "" if key == "" else "[{}]".format(key)
+        else:
+            full_key = "{}".format(key)
+        return self._get_full_key_prefix() + full_key
+
+    def _get_full_key_prefix(self) -> str:
+        """
+        :return: the full key of this container, formatted as a prefix for the keys of its children
+        """
+        from .listconfig import ListConfig
+
+        # segments are collected from this container up to the root and joined once
+        segments: List[str] = []
+        node: BaseContainer = self
+        parent: Optional[BaseContainer] = node.__dict__["parent"]
         while parent is not None:
-            assert isinstance(parent, (DictConfig, ListConfig))
-            if isinstance(parent, DictConfig):
-                if child is None:
-                    full_key = "{}".format(key)
-                else:
-                    # find which the key for child in the parent
-                    for parent_key in parent.keys():
-                        if id(parent.get_node(parent_key)) == id(child):
-                            if isinstance(child, ListConfig):
-                                full_key = "{}{}".format(parent_key, full_key)
-                            else:
-                                full_key = "{}.{}".format(parent_key, full_key)
-                            break
-            elif isinstance(parent, ListConfig):
-                if child is None:
-                    if key == "":
-                        full_key = key
-                    else:
-                        full_key = "[{}]".format(key)
+            key = node._get_key_in_parent()
+            if key is not None:
+                if not isinstance(node, ListConfig):
+                    segments.append(".")
+                if isinstance(parent, ListConfig):
+                    segments.append("[{}]".format(key))
                 else:
-                    for idx, v in enumerate(parent):
-                        if id(v) == id(child):
-                            if isinstance(child, ListConfig):
-                                full_key = "[{}]{}".format(idx, full_key)
-                            else:
-                                full_key = "[{}].{}".format(idx, full_key)
-                            break
-            child = parent
-            parent = child._get_parent()
-
-        return full_key
+                    segments.append("{}".format(key))
+            node = parent
+            parent = node.__dict__["parent"]
+        segments.reverse()
+        return "".join(segments)
+
+    def _get_key_in_parent(self) -> Optional[Union[str, int]]:
+        """
+        :return: the key (or index) of this container in its parent, None if it is not found.
+        The result is cached and is validated against the parent content on every call.
+        """
+        parent = self.__dict__["parent"]
+        content = parent.__dict__["content"]
+        key = self.__dict__.get("_key_in_parent")
+        if isinstance(content, dict):
+            if key is not None and content.get(key) is self:
+                return key  # type: ignore
+            items: Any = content.items()
+        else:
+            if isinstance(key, int) and key < len(content) and content[key] is self:
+                return key
+            items = enumerate(content)
+
+        for k, v in items:
+            if v is self:
+                self.__dict__["_key_in_parent"] = k
+                return k  # type: ignore
+        return None
 
     def __str__(self) -> str:
         return self.content.__str__()  # type: ignore
@@ -117,7 +137,52 @@ class BaseContainer(Container):
 
     # Support pickle
     def __setstate__(self, d: Dict[str, Any]) -> None:
-        self.__dict__.update(d)
+        super().__setstate__(d)
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "BaseContainer":
+        # The tree is copied using an explicit work list rather than by recursing
+        # through the __deepcopy__ of every nested container.
+        # Every copied node is registered in memo, like copy.deepcopy() does.
+        if memo is None:
+            memo = {}
+        res = self._copy_empty()
+        memo[id(self)] = res
+        stack = [(self, res)]
+        while len(stack) > 0:
+            src, dst = stack.pop()
+            content = src.__dict__["content"]
+            if isinstance(content, dict):
+                content = dict(content)
+                keys: Any = content.keys()
+            else:
+                content = list(content)
+                keys = range(len(content))
+            for key in keys:
+                node = content[key]
+                node_copy = memo.get(id(node))
+                if node_copy is None:
+                    if isinstance(node, BaseContainer):
+                        node_copy = node._copy_empty()
+                        memo[id(node)] = node_copy
+                        stack.append((node, node_copy))
+                    else:
+                        node_copy = node.__deepcopy__(memo)
+                node_copy.__dict__["parent"] = dst
+                content[key] = node_copy
+            dst.__dict__["content"] = content
+        return res
+
+    def _copy_empty(self) -> "BaseContainer":
+        """
+        :return: a copy of this container without a parent, sharing the content
+        of this container. the content is expected to be replaced by the caller.
+        """
+        res = object.__new__(type(self))
+        res.__dict__.update(self.__dict__)
+        res.__dict__["parent"] = None
+        res.__dict__["flags"] = self._copy_flags()
+        res.__dict__["_resolver_cache"] = defaultdict(dict)
+        return res
 
     def __delitem__(self, key: Union[str, int, slice]) -> None:
         if self._get_flag("readonly"):
@@ -149,7 +214,7 @@ class BaseContainer(Container):
             else:
                 key = arg[0:idx]
                 value = arg[idx + 1 :]
-                value = yaml.load(value, Loader=get_yaml_loader())
+                value = load_yaml_str(value)
 
             self.update_node(key, value)
 
@@ -271,6 +336,10 @@ class BaseContainer(Container):
         :return: A string containing the yaml representation.
         """
         container = OmegaConf.to_container(self, resolve=resolve, enum_to_str=True)
+        if isinstance(container, list):
+            pretty = pretty_plain_list(container)
+            if pretty is not None:
+                return pretty
         return yaml.dump(  # type: ignore
             container, default_flow_style=False, allow_unicode=True
         )
@@ -65,23 +65,11 @@ class DictConfig(BaseContainer, MutableMapping[str, Any]):
                 for field in ["flags", "_element_type", "_resolver_cache"]:
                     self.__dict__[field] = copy.deepcopy(content.__dict__[field])
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "DictConfig":
-        res = DictConfig({})
-        res.__dict__["content"] = copy.deepcopy(self.__dict__["content"], memo=memo)
-        res.__dict__["flags"] = copy.deepcopy(self.__dict__["flags"], memo=memo)
-        res.__dict__["_element_type"] = copy.deepcopy(
-            self.__dict__["_element_type"], memo=memo
-        )
-
-        res.__dict__["_type"] = copy.deepcopy(self.__dict__["_type"], memo=memo)
-        _re_parent(res)
-        return res
-
     def __copy__(self) -> "DictConfig":
         res = DictConfig(content={}, element_type=self.__dict__["_element_type"])
         res.__dict__["content"] = copy.copy(self.__dict__["content"])
         res.__dict__["_type"] = self.__dict__["_type"]
-        res.__dict__["flags"] = copy.copy(self.__dict__["flags"])
+        res.__dict__["flags"] = self._copy_flags()
         _re_parent(res)
         return res
 
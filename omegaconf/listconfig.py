@@ -1,9 +1,9 @@
 import copy
 import itertools
+from enum import Enum
 from typing import (
     Any,
     Callable,
-    Dict,
     Iterable,
     Iterator,
     List,
@@ -13,7 +13,7 @@ from typing import (
     Union,
 )
 
-from ._utils import _re_parent, is_primitive_list, isint
+from ._utils import _PRIMITIVE_TYPES, is_primitive_list, isint
 from .base import Container, Node
 from .basecontainer import BaseContainer
 from .errors import ReadonlyConfigError, UnsupportedKeyType, UnsupportedValueType
@@ -30,18 +30,19 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         super().__init__(parent=parent, element_type=element_type)
         self.__dict__["content"] = []
         assert is_primitive_list(content) or isinstance(content, ListConfig)
-        for item in content:
-            self.append(item)
-
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "ListConfig":
-        res = ListConfig(content=[])
-        res.__dict__["content"] = copy.deepcopy(self.__dict__["content"], memo=memo)
-        res.__dict__["flags"] = copy.deepcopy(self.__dict__["flags"], memo=memo)
-        res.__dict__["_element_type"] = copy.deepcopy(
-            self.__dict__["_element_type"], memo=memo
-        )
-        _re_parent(res)
-        return res
+        if (
+            element_type is Any
+            and isinstance(content, (list, tuple))
+            and all(type(item) in _PRIMITIVE_TYPES for item in content)
+            and not self._get_flag("readonly")
+        ):
+            # common case, wrap all items in one pass without going through append()
+            self.__dict__["content"] = [
+                AnyNode(value=item, parent=self) for item in content
+            ]
+        else:
+            for item in content:
+                self.append(item)
 
     def __getattr__(self, key: str) -> Any:
         if isinstance(key, str) and isint(key):
@@ -59,19 +60,23 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
     def __getitem__(self, index: Union[int, slice]) -> Any:
         assert isinstance(index, (int, slice))
         if isinstance(index, slice):
-            result = []
-            for slice_idx in itertools.islice(
-                range(0, len(self)), index.start, index.stop, index.step
-            ):
-                val = self._resolve_with_default(
-                    key=slice_idx, value=self.content[slice_idx], default_value=None
+            return [
+                self._get_at(slice_idx)
+                for slice_idx in itertools.islice(
+                    range(0, len(self)), index.start, index.stop, index.step
                 )
-                result.append(val)
-            return result
+            ]
         else:
-            return self._resolve_with_default(
-                key=index, value=self.content[index], default_value=None
-            )
+            return self._get_at(index)
+
+    def _get_at(self, index: int) -> Any:
+        node = self.__dict__["content"][index]
+        # Only strings can be interpolations or missing values, anything else
+        # (primitives and containers) is returned without resolving.
+        value = node.__dict__.get("val", node)
+        if not isinstance(value, str):
+            return value
+        return self._resolve_with_default(key=index, value=node, default_value=None)
 
     def _set_at_index(self, index: Union[int, slice], value: Any) -> None:
         if not isinstance(index, int):
@@ -122,6 +127,10 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
     def insert(self, index: int, item: Any) -> None:
         if self._get_flag("readonly"):
             raise ReadonlyConfigError(self.get_full_key(str(index)))
+        if self.__dict__["_element_type"] is Any and type(item) in _PRIMITIVE_TYPES:
+            # nothing to validate or copy, wrap the value directly
+            self.__dict__["content"].insert(index, AnyNode(value=item, parent=self))
+            return
         try:
             self.content.insert(index, AnyNode(None))
             self._set_at_index(index, item)
@@ -131,8 +140,25 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
 
     def extend(self, lst: Iterable[Any]) -> None:
         assert isinstance(lst, (tuple, list, ListConfig))
-        for x in lst:
-            self.append(x)
+        if isinstance(lst, ListConfig) and self.__dict__["_element_type"] is Any:
+            # values of another config are always supported, wrap them in bulk.
+            # like append(), the values are wrapped again and the source node types
+            # and flags are not carried over.
+            if self._get_flag("readonly"):
+                raise ReadonlyConfigError(self.get_full_key(f"{len(self)}"))
+            from omegaconf.omegaconf import _maybe_wrap
+
+            self.__dict__["content"].extend(
+                [
+                    _maybe_wrap(
+                        annotated_type=Any, value=x, is_optional=True, parent=self
+                    )
+                    for x in lst
+                ]
+            )
+        else:
+            for x in lst:
+                self.append(x)
 
     def remove(self, x: Any) -> None:
         del self[self.index(x)]
@@ -149,23 +175,37 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             end = len(self)
         assert start >= 0
         assert end <= len(self)
-        found_idx = -1
-        for idx in range(start, end):
-            item = self[idx]
-            if x == item:
-                found_idx = idx
-                break
-        if found_idx != -1:
-            return found_idx
+        values = self._unresolved_values(start, end)
+        if all(not isinstance(v, str) or not _needs_resolve(v) for v in values):
+            # nothing to resolve, let list.index() do the scan
+            try:
+                return start + values.index(x)
+            except ValueError:
+                pass
         else:
-            raise ValueError("Item not found in ListConfig")
+            for idx in range(start, end):
+                item = self[idx]
+                if x == item:
+                    return idx
+        raise ValueError("Item not found in ListConfig")
 
     def count(self, x: Any) -> int:
-        c = 0
-        for item in self:
-            if item == x:
-                c = c + 1
-        return c
+        return self._unresolved_values(0, len(self)).count(x)
+
+    def _unresolved_values(self, start: int, end: int) -> List[Any]:
+        """
+        :return: the values of the items in range [start, end), ValueNodes are unwrapped
+        """
+        return [x.__dict__.get("val", x) for x in self.__dict__["content"][start:end]]
+
+    def __copy__(self) -> "ListConfig":
+        res = self._copy_empty()
+        assert isinstance(res, ListConfig)
+        # the copy keeps the parent of this list to resolve interpolations.
+        # the nodes are shared and stay attached to this list.
+        res.__dict__["parent"] = self.__dict__["parent"]
+        res.__dict__["content"] = list(self.__dict__["content"])
+        return res
 
     def copy(self) -> "ListConfig":
         return copy.copy(self)
@@ -195,25 +235,52 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         if self._get_flag("readonly"):
             raise ReadonlyConfigError()
 
-        if key is None:
-
-            def key1(x: Any) -> Any:
-                return x.value()
-
-        else:
-
-            def key1(x: Any) -> Any:
-                return key(x.value())  # type: ignore
-
-        self.content.sort(key=key1, reverse=reverse)
+        content = self.__dict__["content"]
+        values = [x.__dict__.get("val", x) for x in content]
+        if key is not None:
+            values = [key(v) for v in values]
+        # sort indices by the precomputed values, keys are looked up in C without
+        # calling back into Python for each node
+        order = sorted(range(len(content)), key=values.__getitem__, reverse=reverse)
+        content[:] = [content[i] for i in order]
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, list):
+            eq = self._primitive_list_eq(other)
+            if eq is not None:
+                return eq
             return BaseContainer._list_eq(self, ListConfig(other))
         if isinstance(other, ListConfig):
+            eq = self._primitive_list_eq(other.__dict__["content"])
+            if eq is not None:
+                return eq
             return BaseContainer._list_eq(self, other)
         return NotImplemented
 
+    def _primitive_list_eq(self, other: List[Any]) -> Optional[bool]:
+        """
+        Compares this list to a list of values or nodes without wrapping or resolving.
+        :return: the result, or None if the lengths differ or either side contains
+        containers, interpolations or unsupported values
+        """
+        content = self.__dict__["content"]
+        if len(content) != len(other):
+            return None
+        # all values are checked before returning, unsupported values in other must
+        # fall back to the full comparison (which raises) even after a mismatch.
+        eq = True
+        for node, v2 in zip(content, other):
+            if not isinstance(node, ValueNode):
+                return None
+            v1 = node.__dict__["val"]
+            if isinstance(v2, ValueNode):
+                v2 = v2.__dict__["val"]
+            if not _is_plain_value(v1) or not _is_plain_value(v2):
+                return None
+            if eq and v1 != v2:
+                eq = False
+        return eq
+
     def __ne__(self, other: Any) -> bool:
         x = self.__eq__(other)
         if x is not NotImplemented:
@@ -221,24 +288,14 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        # hashing the values instead of str(self) is faster, and consistent with
+        # __eq__ for values that are equal but print differently (1 and True).
+        return hash(tuple(self._unresolved_values(0, len(self))))
 
     def __iter__(self) -> Iterator[Any]:
-        class MyItems(Iterator[Any]):
-            def __init__(self, lst: List[Any]) -> None:
-                self.lst = lst
-                self.iterator = iter(lst)
-
-            def __next__(self) -> Any:
-                return self.next()
-
-            def next(self) -> Any:
-                v = next(self.iterator)
-                if isinstance(v, ValueNode):
-                    v = v.value()
-                return v
-
-        return MyItems(self.content)
+        # ValueNodes are unwrapped inline (see __contains__), a generator
+        # expression is cheaper to advance than an iterator class.
+        return (x.__dict__.get("val", x) for x in self.__dict__["content"])
 
     def __add__(self, other: Union[List[Any], "ListConfig"]) -> "ListConfig":
         # res is sharing this list's parent to allow interpolation to work as expected
@@ -252,7 +309,20 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         return self
 
     def __contains__(self, item: Any) -> bool:
-        for x in iter(self):
-            if x == item:
+        # ValueNodes are unwrapped by looking up "val" in their __dict__, containers
+        # do not have it and are compared as is. This is much cheaper than an
+        # isinstance() check against the (abstract) ValueNode class.
+        for x in self.__dict__["content"]:
+            if x.__dict__.get("val", x) == item:
                 return True
         return False
+
+
+def _needs_resolve(value: str) -> bool:
+    return "${" in value or value == "???"
+
+
+def _is_plain_value(value: Any) -> bool:
+    if type(value) is str:
+        return "${" not in value
+    return value is None or type(value) in (int, float, bool) or isinstance(value, Enum)
@@ -4,6 +4,7 @@ from abc import abstractmethod
 from enum import Enum
 from typing import Any, Dict, Optional, Type
 
+from ._utils import _PRIMITIVE_TYPES, _is_missing_literal
 from .base import Node
 from .basecontainer import BaseContainer
 from .errors import UnsupportedValueType, ValidationError
@@ -18,22 +19,35 @@ class ValueNode(Node):
         assert isinstance(is_optional, bool)
         self.is_optional = is_optional
         self.val = None
+        # cached result of _is_missing_literal(val), updated in set_value()
+        self.__dict__["_missing"] = False
 
     def value(self) -> Any:
         return self.val
 
+    def _is_missing(self) -> bool:
+        missing: Optional[bool] = self.__dict__.get("_missing")
+        if missing is None:
+            # nodes pickled before _missing was introduced
+            missing = _is_missing_literal(self.val)
+            self.__dict__["_missing"] = missing
+        return bool(missing)
+
     def set_value(self, value: Any) -> None:
         from ._utils import ValueKind, get_value_kind
 
-        if isinstance(value, str) and get_value_kind(value) in (
-            ValueKind.INTERPOLATION,
-            ValueKind.MANDATORY_MISSING,
-        ):
+        if _is_missing_literal(value):
+            self.val = value
+            self.__dict__["_missing"] = True
+            return
+
+        if isinstance(value, str) and get_value_kind(value) == ValueKind.INTERPOLATION:
             self.val = value
         else:
             if not self.is_optional and value is None:
                 raise ValidationError("Non optional field cannot be assigned None")
             self.val = self.validate_and_convert(value)
+        self.__dict__["_missing"] = False
 
     @abstractmethod
     def validate_and_convert(self, value: Any) -> Any:
@@ -57,9 +71,20 @@ class ValueNode(Node):
         assert x is not NotImplemented
         return not x
 
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "ValueNode":
+        # avoid running the subclass __init__ and validation for the copy
+        if memo is None:
+            memo = {}
+        res = object.__new__(type(self))
+        res.__dict__.update(self.__dict__)
+        memo[id(self)] = res
+        self._deepcopy_impl(res, memo)
+        return res
+
     def _deepcopy_impl(self, res: Any, memo: Optional[Dict[int, Any]] = {}) -> None:
         res.__dict__["val"] = copy.deepcopy(x=self.__dict__["val"], memo=memo)
-        res.__dict__["flags"] = copy.deepcopy(x=self.__dict__["flags"], memo=memo)
+        res.__dict__["flags"] = self._copy_flags()
+        res.__dict__["_missing"] = self._is_missing()
         res.__dict__["is_optional"] = copy.deepcopy(
             x=self.__dict__["is_optional"], memo=memo
         )
@@ -80,6 +105,9 @@ class AnyNode(ValueNode):
         self.set_value(value)
 
     def validate_and_convert(self, value: Any) -> Any:
+        if type(value) in _PRIMITIVE_TYPES:
+            return value
+
         from .omegaconf import _is_primitive_type
 
         if not _is_primitive_type(value):
@@ -88,11 +116,6 @@ class AnyNode(ValueNode):
             )
         return value
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "AnyNode":
-        res = AnyNode()
-        self._deepcopy_impl(res, memo)
-        return res
-
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, AnyNode):
             return self.val == other.val and self.is_optional == other.is_optional
@@ -114,11 +137,6 @@ class StringNode(ValueNode):
     def validate_and_convert(self, value: Any) -> Optional[str]:
         return str(value) if value is not None else None
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "StringNode":
-        res = StringNode()
-        self._deepcopy_impl(res, memo)
-        return res
-
 
 class IntegerNode(ValueNode):
     def __init__(
@@ -143,11 +161,6 @@ class IntegerNode(ValueNode):
             raise ValidationError(f"Value '{value}' could not be converted to Integer")
         return val
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "IntegerNode":
-        res = IntegerNode()
-        self._deepcopy_impl(res, memo)
-        return res
-
 
 class FloatNode(ValueNode):
     def __init__(
@@ -186,11 +199,6 @@ class FloatNode(ValueNode):
         nan2 = math.isnan(other_val) if isinstance(other_val, float) else False
         return self.val == other_val or (nan1 and nan2)
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "FloatNode":
-        res = FloatNode()
-        self._deepcopy_impl(res, memo)
-        return res
-
 
 class BooleanNode(ValueNode):
     def __init__(
@@ -227,11 +235,6 @@ class BooleanNode(ValueNode):
                 f"Value '{value}' is not a valid bool (type {type(value).__name__})"
             )
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "BooleanNode":
-        res = BooleanNode()
-        self._deepcopy_impl(res, memo)
-        return res
-
 
 class EnumNode(ValueNode):
     """
@@ -294,11 +297,6 @@ class EnumNode(ValueNode):
             return self.enum_type[key]
         assert False  # pragma: no cover
 
-    def __deepcopy__(self, memo: Dict[int, Any] = {}) -> "EnumNode":
-        res = EnumNode(enum_type=self.enum_type)
-        self._deepcopy_impl(res, memo)
-        return res
-
     def __eq__(self, other: Any) -> bool:
         sr = super().__eq__(other)
         if sr is False:
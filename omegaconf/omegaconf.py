@@ -2,10 +2,12 @@
 import copy
 import io
 import os
+import pickle
 import re
 import sys
 from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from typing import (
     IO,
     Any,
@@ -25,6 +27,7 @@ from typing_extensions import Protocol
 
 from . import DictConfig, ListConfig
 from ._utils import (
+    _PRIMITIVE_TYPES,
     decode_primitive,
     is_primitive_container,
     is_primitive_dict,
@@ -136,20 +139,33 @@ class OmegaConf:
     @staticmethod
     def create(  # noqa F811
         obj: Any = None, parent: Optional[BaseContainer] = None
+    ) -> Union[DictConfig, ListConfig]:
+        if parent is None:
+            if type(obj) in (list, tuple) and len(obj) == 0:
+                return copy.copy(_EMPTY_LIST_CONFIG)
+            cache_key = _create_cache_key(obj)
+            if cache_key is not None:
+                return copy.deepcopy(_create_cached(cache_key))
+        return OmegaConf._create_impl(obj, parent)
+
+    @staticmethod
+    def _create_impl(
+        obj: Any = None, parent: Optional[BaseContainer] = None
     ) -> Union[DictConfig, ListConfig]:
         from ._utils import get_yaml_loader
         from .dictconfig import DictConfig
         from .listconfig import ListConfig
 
         if isinstance(obj, str):
+            # not using load_yaml_str(), create() already caches the result by text
             obj = yaml.load(obj, Loader=get_yaml_loader())
             if obj is None:
-                return OmegaConf.create({})
+                return OmegaConf._create_impl({})
             elif isinstance(obj, str):
-                return OmegaConf.create({obj: None})
+                return OmegaConf._create_impl({obj: None})
             else:
                 assert isinstance(obj, (list, dict))
-                return OmegaConf.create(obj)
+                return OmegaConf._create_impl(obj)
 
         else:
             if obj is None:
@@ -174,11 +190,11 @@ class OmegaConf:
             with io.open(os.path.abspath(file_), "r", encoding="utf-8") as f:
                 obj = yaml.load(f, Loader=get_yaml_loader())
                 assert isinstance(obj, (list, dict, str))
-                return OmegaConf.create(obj)
+                return OmegaConf._create_impl(obj)
         elif getattr(file_, "read", None):
             obj = yaml.load(file_, Loader=get_yaml_loader())
             assert isinstance(obj, (list, dict, str))
-            return OmegaConf.create(obj)
+            return OmegaConf._create_impl(obj)
         else:
             raise TypeError("Unexpected file type")
 
@@ -449,6 +465,10 @@ def _node_wrap(
 def _maybe_wrap(
     annotated_type: Any, value: Any, is_optional: bool, parent: Optional[BaseContainer]
 ) -> Node:
+    if annotated_type is Any and type(value) in _PRIMITIVE_TYPES:
+        # common case, skip the container and structured config checks below
+        return AnyNode(value=value, parent=parent, is_optional=is_optional)
+
     if isinstance(value, ValueNode):
         return value
 
@@ -512,6 +532,48 @@ def _maybe_wrap(
     return value
 
 
+def _is_plain_data(obj: Any) -> bool:
+    """
+    :return: True if obj is made only of builtin containers, str keys and primitive values
+    """
+    type_ = type(obj)
+    if type_ in (int, float, bool, str, type(None)):
+        return True
+    if type_ in (list, tuple):
+        return all(_is_plain_data(x) for x in obj)
+    if type_ is dict:
+        return all(type(k) is str and _is_plain_data(v) for k, v in obj.items())
+    return False
+
+
+def _create_cache_key(obj: Any) -> Optional[Tuple[str, Any]]:
+    """
+    Returns a hashable key identifying the input of OmegaConf.create(), or None if
+    the input can not be safely cached (nodes, configs, structured configs etc).
+    """
+    if isinstance(obj, str):
+        return "yaml", obj
+    if type(obj) in (list, tuple, dict) and _is_plain_data(obj):
+        return "pickle", pickle.dumps(obj)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _create_cached(cache_key: Tuple[str, Any]) -> Union[DictConfig, ListConfig]:
+    """
+    Creates a config from a key returned by _create_cache_key().
+    The result is shared, callers must return a copy of it.
+    """
+    kind, data = cache_key
+    obj = data if kind == "yaml" else pickle.loads(data)
+    return OmegaConf._create_impl(obj)
+
+
+# prototype for OmegaConf.create([]), a shallow copy of it is cheaper than creating
+# a new ListConfig. it must never be modified or returned directly.
+_EMPTY_LIST_CONFIG = ListConfig(content=[])
+
+
 def _select_one(c: BaseContainer, key: str) -> Tuple[Any, Union[str, int]]:
     from .dictconfig import DictConfig
     from .listconfig import ListConfig
@@ -237,6 +237,35 @@ def test_deepcopy_with_interpolation() -> None:
     assert c2.a.b == 10
 
 
+def test_deepcopy_nested_parents() -> None:
+    c1 = OmegaConf.create({"a": [{"b": [1, {"c": "${x}"}]}], "x": 10})
+    c2 = copy.deepcopy(c1)
+    assert c1 == c2
+    assert c2._get_parent() is None
+    assert c2.get_node("a")._get_parent() is c2
+    assert c2.a.get_node(0)._get_parent() is c2.a
+    assert c2.a[0].b.get_node(0)._get_parent() is c2.a[0].b
+    assert c2.a[0].b[1].c == 10
+    c2.a[0].b[1].c = 20
+    assert c1.a[0].b[1].c == 10
+
+
+@pytest.mark.parametrize("reverse", [False, True])  # type: ignore
+def test_deepcopy_shared_references(reverse: bool) -> None:
+    c = OmegaConf.create({"a": {"b": [1, 2]}, "x": 10})
+    src = [c, c.a, c.a.b, c.get_node("x")]
+    if reverse:
+        cfg, a, b, x = reversed(copy.deepcopy(src[::-1]))
+    else:
+        cfg, a, b, x = copy.deepcopy(src)
+    assert cfg.get_node("a") is a
+    assert a.get_node("b") is b
+    assert cfg.get_node("x") is x
+    assert b._get_parent() is a
+    assert x._get_parent() is cfg
+    assert cfg == c
+
+
 # Yes, there was a bug that was a combination of an interaction between the three
 def test_deepcopy_and_merge_and_flags() -> None:
     c1 = OmegaConf.create(
@@ -403,6 +432,24 @@ class TestCopy:
         assert id(cfg) != id(cp)
         assert id(cfg[0]) == id(cp[0])
 
+    def test_list_copy_has_own_content(self, copy_method: Any) -> None:
+        cfg = OmegaConf.create([1, 2])
+        cp = copy_method(cfg)
+        cp.append(3)
+        del cp[0]
+        assert cfg == [1, 2]
+        assert cp == [2, 3]
+
+    def test_nested_list_copy_interpolation(self, copy_method: Any) -> None:
+        cfg = OmegaConf.create({"x": 1, "l": ["${x}", {"a": "${x}"}]})
+        cp = copy_method(cfg.l)
+        assert cp[0] == 1
+        assert cp[1].a == 1
+        assert cfg.l[0] == 1
+        assert cfg.l[1].a == 1
+        assert cfg.l[1].get_full_key("a") == "l[1].a"
+        assert cfg.l.get_node(0)._get_parent() is cfg.l
+
 
 def test_not_implemented() -> None:
     with pytest.raises(NotImplementedError):
@@ -471,3 +518,13 @@ def test_assign(parent: Any, index: Union[str, int], value: Any, expected: Any)
     c = OmegaConf.create(parent)
     c[index] = value
     assert c == expected
+
+
+def test_flags_are_not_shared() -> None:
+    c = OmegaConf.create({"a": 1, "b": [1]})
+    c2 = copy.deepcopy(c)
+    OmegaConf.set_readonly(c.get_node("a"), True)
+    assert OmegaConf.is_readonly(c.get_node("a"))
+    assert not OmegaConf.is_readonly(c.get_node("b"))
+    assert not OmegaConf.is_readonly(c2.get_node("a"))
+    assert not OmegaConf.is_readonly(OmegaConf.create({"a": 1}).get_node("a"))
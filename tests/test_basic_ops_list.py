@@ -5,7 +5,11 @@ from typing import Any, List, Optional
 import pytest
 
 from omegaconf import AnyNode, ListConfig, OmegaConf
-from omegaconf.errors import UnsupportedKeyType, UnsupportedValueType
+from omegaconf.errors import (
+    MissingMandatoryValue,
+    UnsupportedKeyType,
+    UnsupportedValueType,
+)
 from omegaconf.nodes import IntegerNode, StringNode
 
 from . import IllegalType, does_not_raise
@@ -79,11 +83,33 @@ def test_in_list() -> None:
     assert "blah" not in c
 
 
+def test_in_list_nested_and_none() -> None:
+    c = OmegaConf.create([None, [1, 2], IntegerNode(3)])
+    assert None in c
+    assert [1, 2] in c
+    assert 3 in c
+    assert [1] not in c
+    assert "val" not in c
+
+
 def test_list_config_with_list() -> None:
     c = OmegaConf.create([])
     assert isinstance(c, ListConfig)
 
 
+@pytest.mark.parametrize(  # type: ignore
+    "input_", [[1, "a", None, 1.5, True], (1, "${0}", "???")]
+)
+def test_list_config_of_primitives(input_: Any) -> None:
+    c = ListConfig(input_)
+    assert len(c) == len(input_)
+    for idx in range(len(c)):
+        node = c.get_node(idx)
+        assert type(node) == AnyNode
+        assert node._get_parent() is c
+        assert node.value() == input_[idx]
+
+
 def test_list_config_with_tuple() -> None:
     c = OmegaConf.create(())
     assert isinstance(c, ListConfig)
@@ -162,6 +188,16 @@ def test_list_index(index: Any, expected: Any) -> None:
     assert c[index] == expected
 
 
+def test_list_index_resolves_strings() -> None:
+    c = OmegaConf.create([10, "${0}", "???", dict(a="${0}"), None])
+    assert c[1] == 10
+    assert c[0:2] == [10, 10]
+    assert c[3].a == 10
+    assert c[4] is None
+    with pytest.raises(MissingMandatoryValue):
+        c[2]
+
+
 def test_list_dir() -> None:
     c = OmegaConf.create([1, 2, 3])
     assert ["0", "1", "2"] == dir(c)
@@ -192,6 +228,7 @@ def test_insert(
     c.insert(index, value)
     assert c == expected
     assert type(c.get_node(index)) == expected_node_type
+    assert c.get_node(index)._get_parent() is c
 
 
 @pytest.mark.parametrize(  # type: ignore
@@ -208,6 +245,36 @@ def test_extend(src: List[Any], append: List[Any], result: List[Any]) -> None:
     assert lst == result
 
 
+def test_extend_with_list_config() -> None:
+    lst = OmegaConf.create([1, dict(a=2)])
+    lst.extend(lst)
+    assert lst == [1, dict(a=2), 1, dict(a=2)]
+    lst[1].a = 3
+    assert lst == [1, dict(a=3), 1, dict(a=2)]
+    assert lst.get_node(3)._get_parent() is lst
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "op",
+    [
+        lambda c, src: c.__iadd__(src),
+        lambda c, src: c + src,
+        lambda c, src: src + [],
+    ],
+)
+def test_extend_with_list_config_rewraps_values(op: Any) -> None:
+    src = OmegaConf.create([IntegerNode(1), {"k": 1}])
+    src.get_node(0)._set_flag("readonly", True)
+    src[1].get_node("k")._set_flag("readonly", True)
+    c = op(OmegaConf.create([]), src)
+    assert c == [1, {"k": 1}]
+    assert type(c.get_node(0)) is AnyNode
+    c[0] = "x"
+    c[1].k = 2
+    assert c == ["x", {"k": 2}]
+    assert src == [1, {"k": 1}]
+
+
 @pytest.mark.parametrize(  # type: ignore
     "src, remove, result, expectation",
     [
@@ -240,6 +307,10 @@ def test_clear(src: List[Any], num_clears: int) -> None:
         ([], 20, -1, pytest.raises(ValueError)),
         ([10, 20], 10, 0, does_not_raise()),
         ([10, 20], 20, 1, does_not_raise()),
+        (["a", dict(a=10)], dict(a=10), 1, does_not_raise()),
+        ([10, "${0}"], 10, 0, does_not_raise()),
+        (["${1}", 20], 20, 0, does_not_raise()),
+        ([10, "???"], 20, -1, pytest.raises(MissingMandatoryValue)),
     ],
 )
 def test_index(
@@ -264,7 +335,13 @@ def test_index_with_range() -> None:
 
 @pytest.mark.parametrize(  # type: ignore
     "src, item, count",
-    [([], 10, 0), ([10], 10, 1), ([10, 2, 10], 10, 2), ([10, 2, 10], None, 0)],
+    [
+        ([], 10, 0),
+        ([10], 10, 1),
+        ([10, 2, 10], 10, 2),
+        ([10, 2, 10], None, 0),
+        ([[1], dict(a=1), [1]], [1], 2),
+    ],
 )
 def test_count(src: List[Any], item: Any, count: int) -> None:
     lst = OmegaConf.create(src)
@@ -283,6 +360,15 @@ def test_sort() -> None:
     assert ["bbb", "aa", "c"] == c
 
 
+def test_sort_is_stable() -> None:
+    c = OmegaConf.create(["b1", "a1", "b2", "a2", IntegerNode(1)])
+    c.sort(key=lambda x: str(x)[0])
+    assert c == [1, "a1", "a2", "b1", "b2"]
+    assert type(c.get_node(0)) == IntegerNode
+    c.sort(key=lambda x: str(x)[0], reverse=True)
+    assert c == ["b1", "b2", "a1", "a2", 1]
+
+
 def test_insert_throws_not_changing_list() -> None:
     c = OmegaConf.create([])
     with pytest.raises(ValueError):
@@ -307,6 +393,15 @@ def test_hash() -> None:
     assert hash(c1) != hash(c2)
 
 
+def test_hash_consistent_with_eq() -> None:
+    c1 = OmegaConf.create([1, 2.0, [3], dict(a=4)])
+    c2 = OmegaConf.create([True, 2, [3], dict(a=4)])
+    assert c1 == c2
+    assert hash(c1) == hash(c2)
+    c2[2].append(5)
+    assert hash(c1) != hash(c2)
+
+
 @pytest.mark.parametrize(
     "in_list1, in_list2,in_expected",
     [
@@ -345,3 +440,35 @@ def test_set_with_invalid_key() -> None:
     cfg = OmegaConf.create([1, 2, 3])
     with pytest.raises(UnsupportedKeyType):
         cfg["foo"] = 4  # type: ignore
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "lst, other, expected",
+    [
+        ([], [], True),
+        ([1, 2], [1, 2], True),
+        ([1, 2], [1, 3], False),
+        ([1, 2], [1, 2, 3], False),
+        ([1, "a", None, 1.5], [1, "a", None, 1.5], True),
+        ([1, 2], [IntegerNode(1), IntegerNode(2)], True),
+        ([[1, 2]], [[1, 2]], True),
+        ([dict(a=1)], [dict(a=2)], False),
+        (["${1}", 10], [10, 10], True),
+        ([10, 10], ["${1}", 10], True),
+    ],
+)
+def test_list_eq(lst: List[Any], other: List[Any], expected: bool) -> None:
+    c = OmegaConf.create(lst)
+    assert (c == other) == expected
+    assert (c == ListConfig(other)) == expected
+    assert (c != other) != expected
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "other",
+    [[IllegalType()], [IllegalType(), 2], [1, IllegalType()], [2, IllegalType()]],
+)
+def test_list_eq_with_illegal_value(other: List[Any]) -> None:
+    c = OmegaConf.create([1])
+    with pytest.raises(UnsupportedValueType):
+        c == other
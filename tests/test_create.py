@@ -110,3 +110,32 @@ def test_create_from_oc_with_flags() -> None:
     c2 = OmegaConf.create(c1)
     assert c1 == c2
     assert c1.flags == c2.flags
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "input_", ["a: [1, 2]", [1, [2, 3]], (1, 2), {"a": {"b": [1, 2]}}, [], ()]
+)
+def test_create_returns_independent_copies(input_: Any) -> None:
+    c1 = OmegaConf.create(input_)
+    c2 = OmegaConf.create(input_)
+    assert c1 == c2
+    assert c1 is not c2
+    OmegaConf.set_readonly(c1, True)
+    assert not OmegaConf.is_readonly(c2)
+    c2.merge_with({"a": 10} if OmegaConf.is_dict(c2) else [10])
+    assert OmegaConf.create(input_) == c1
+
+
+def test_create_distinguishes_equal_values_of_different_types() -> None:
+    assert type(OmegaConf.create([1])[0]) is int
+    assert type(OmegaConf.create([True])[0]) is bool
+    assert type(OmegaConf.create([1.0])[0]) is float
+
+
+def test_create_from_yaml_does_not_use_parse_cache() -> None:
+    # create() caches the config by text, the parsed data is not cached again
+    from omegaconf import _utils
+
+    _utils._load_yaml_cached.cache_clear()
+    assert OmegaConf.create("a: [1, 2]  # parse cache test") == {"a": [1, 2]}
+    assert _utils._load_yaml_cached.cache_info().currsize == 0
@@ -82,3 +82,22 @@ class TestGetFullKey:
         c = OmegaConf.create(dict(x="???", a=1, b=dict(c=1)))
         assert isinstance(c, DictConfig)
         assert c.b.get_full_key("c") == "b.c"
+
+    def test_after_list_insert(self) -> None:
+        c = OmegaConf.create([dict(a=1), dict(b=2)])
+        assert isinstance(c, ListConfig)
+        b = c[1]
+        assert b.get_full_key("b") == "[1].b"
+        c.insert(0, 10)
+        assert b.get_full_key("b") == "[2].b"
+        del c[0]
+        assert b.get_full_key("b") == "[1].b"
+
+    def test_after_dict_replace(self) -> None:
+        c = OmegaConf.create(dict(a=dict(x=1)))
+        assert isinstance(c, DictConfig)
+        a = c.a
+        assert a.get_full_key("x") == "a.x"
+        c.b = c.pop("a")
+        assert c.b.get_full_key("x") == "b.x"
+        assert a.get_full_key("x") == "x"
@@ -469,3 +469,24 @@ def test_eq(node: ValueNode, value: Any, expected: Any) -> None:
     assert (node != value) != expected
     assert (value == node) == expected
     assert (value != node) != expected
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "node", [AnyNode(), StringNode(), IntegerNode(), FloatNode(), BooleanNode()]
+)
+def test_is_missing_cached(node: ValueNode) -> None:
+    assert not node._is_missing()
+    node.set_value("???")
+    assert node._is_missing()
+    assert copy.deepcopy(node)._is_missing()
+    node.set_value(None)
+    assert not node._is_missing()
+
+
+@pytest.mark.parametrize("value, expected", [("???", True), (10, False)])  # type: ignore
+def test_is_missing_without_cached_flag(value: Any, expected: bool) -> None:
+    # nodes unpickled from older versions do not have the cached flag
+    node = AnyNode(value)
+    del node.__dict__["_missing"]
+    assert node._is_missing() == expected
+    assert copy.deepcopy(node)._is_missing() == expected
@@ -41,6 +41,11 @@ from omegaconf import DictConfig, ListConfig, OmegaConf, ReadonlyConfigError
         ),
         ([10], lambda c: c.pop(), raises(ReadonlyConfigError)),
         ([0], lambda c: c.__delitem__(0), raises(ReadonlyConfigError, match="[0]")),
+        (
+            [0],
+            lambda c: c.extend(OmegaConf.create([1])),
+            raises(ReadonlyConfigError, match="[1]"),
+        ),
     ],
 )
 def test_readonly(
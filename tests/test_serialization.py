@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import copy
 import io
 import os
 import tempfile
@@ -92,3 +93,39 @@ def test_pickle_list() -> None:
         fp.seek(0)
         c1 = pickle.load(fp)
         assert c == c1
+
+
+def test_pickle_without_cached_fields() -> None:
+    # configs pickled by older versions do not have the cached fields
+    import pickle
+
+    c = OmegaConf.create({"a": [1, 2, {"b": "???", "c": 10}]})
+    stack = [c]
+    while len(stack) > 0:
+        node = stack.pop()
+        node.__dict__.pop("_missing", None)
+        node.__dict__.pop("_key_in_parent", None)
+        if isinstance(node, Container):
+            content = node.__dict__["content"]
+            stack.extend(content.values() if isinstance(content, dict) else content)
+
+    c1 = pickle.loads(pickle.dumps(c))
+    assert c1.a[2].get_full_key("b") == "a[2].b"
+    assert c1.a[2].c == 10
+    assert c1.a[2].get_node("b")._is_missing()
+    assert copy.deepcopy(c1) == c
+
+
+def test_pickle_flags_are_not_shared() -> None:
+    import pickle
+
+    c = OmegaConf.create({"a": 1, "b": 2, "c": {"d": 3}})
+    c2 = pickle.loads(pickle.dumps(c))
+    OmegaConf.set_readonly(c2.get_node("a"), True)
+    assert OmegaConf.is_readonly(c2.get_node("a"))
+    assert not OmegaConf.is_readonly(c2.get_node("b"))
+    assert not OmegaConf.is_readonly(c2.c)
+    assert not OmegaConf.is_readonly(c2)
+    c2.b = 5
+    c2.c.d = 4
+    assert c2 == {"a": 1, "b": 5, "c": {"d": 4}}
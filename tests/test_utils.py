@@ -222,3 +222,69 @@ def test_re_parent() -> None:
 
     _utils._re_parent(cfg)
     validate(cfg)
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "value, expected",
+    [
+        ("???", True),
+        ("??", False),
+        ("${foo}", False),
+        (None, False),
+        (10, False),
+        (Color.RED, False),
+    ],
+)
+def test_is_missing_literal(value: Any, expected: bool) -> None:
+    assert _utils._is_missing_literal(value) == expected
+
+
+def test_get_yaml_loader_is_reused() -> None:
+    import yaml
+
+    resolvers = yaml.SafeLoader.yaml_implicit_resolvers
+    loader = _utils.get_yaml_loader()
+    assert _utils.get_yaml_loader() is loader
+    assert yaml.SafeLoader.yaml_implicit_resolvers is resolvers
+
+
+def test_load_yaml_str_returns_copies() -> None:
+    d1 = _utils.load_yaml_str("a: [1, 2]")
+    d1["a"].append(3)
+    assert _utils.load_yaml_str("a: [1, 2]") == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "lst",
+    [
+        ["item1", "item2", {"key3": "value3"}],
+        [1, -2, True, False, None, "_x"],
+        [{}, {"b": 1, "a": None}],
+        ["y", "n", "x_1"],
+        ["item一", "item二", {"key三": "value三"}],
+    ],
+)
+def test_pretty_plain_list(lst: List[Any]) -> None:
+    import yaml
+
+    expected = yaml.dump(lst, default_flow_style=False, allow_unicode=True)
+    assert _utils.pretty_plain_list(lst) == expected
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "lst",
+    [
+        [],
+        [1.5],
+        ["a b"],
+        ["1"],
+        ["${foo}"],
+        ["No"],
+        ["a" * 200],
+        ["a\u2028"],
+        [[1]],
+        [{"a": [1]}],
+    ],
+)
+def test_pretty_plain_list_not_plain(lst: List[Any]) -> None:
+    assert _utils.pretty_plain_list(lst) is None